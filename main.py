@@ -1,23 +1,35 @@
+import hashlib
+import json
 import math
 import os
 import sys
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-import mistune
-from litellm import completion
+import numpy as np
 from pygments import highlight
 from pygments.formatters.html import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
 from pygments.lexers import get_lexer_for_filename
 from pygments.lexers.special import TextLexer
 from pygments.util import ClassNotFound
 from PyQt6.QtCore import pyqtProperty
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtCore import QEasingCurve
+from PyQt6.QtCore import QFileSystemWatcher
+from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QPoint
 from PyQt6.QtCore import QPointF
 from PyQt6.QtCore import QPropertyAnimation
 from PyQt6.QtCore import QRectF
+from PyQt6.QtCore import QRunnable
 from PyQt6.QtCore import Qt
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QAction
 from PyQt6.QtGui import QBrush
 from PyQt6.QtGui import QColor
@@ -26,7 +38,11 @@ from PyQt6.QtGui import QIcon
 from PyQt6.QtGui import QKeySequence
 from PyQt6.QtGui import QPainter
 from PyQt6.QtGui import QPen
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtGui import QShortcut
+from PyQt6.QtGui import QStaticText
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtGui import QTransform
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QFileDialog
 from PyQt6.QtWidgets import QGraphicsItem
@@ -34,6 +50,7 @@ from PyQt6.QtWidgets import QGraphicsObject
 from PyQt6.QtWidgets import QGraphicsProxyWidget
 from PyQt6.QtWidgets import QGraphicsScene
 from PyQt6.QtWidgets import QGraphicsView
+from PyQt6.QtWidgets import QLabel
 from PyQt6.QtWidgets import QMainWindow
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtWidgets import QStackedLayout
@@ -43,15 +60,245 @@ from PyQt6.QtWidgets import QWidget
 
 FONT = QFont("Fantasque Sans Mono", 12)
 
+# Built once; Qt reparses the QSS string for every widget it is set on
+TEXTEDIT_QSS = f"""
+    QTextEdit {{
+        border: none;
+        font-family: {FONT.family()};
+        font-size: {FONT.pointSize()}pt;
+    }}
+"""
+
+# Fixed instruction prefix shared by every explanation request so the
+# server can reuse its prompt cache between nodes
+EXPLAIN_SYSTEM_PROMPT = (
+    "Please explain the code you are given and return the response in Markdown."
+)
+
+# Extensions treated as readable text; built once instead of per file read.
+TEXT_EXTENSIONS = frozenset(
+    {
+        ".c",
+        ".cfg",
+        ".cpp",
+        ".css",
+        ".go",
+        ".h",
+        ".html",
+        ".ini",
+        ".java",
+        ".js",
+        ".json",
+        ".jsx",
+        ".md",
+        ".py",
+        ".rb",
+        ".rs",
+        ".rst",
+        ".sh",
+        ".sql",
+        ".swift",
+        ".toml",
+        ".ts",
+        ".tsx",
+        ".txt",
+        ".xml",
+        ".yaml",
+        ".yml",
+    }
+)
+
+# Cap on characters shown per node; huge files would dominate highlight
+# and text-layout cost for content nobody scrolls through in a node
+MAX_DISPLAY_CHARS = 64 * 1024
+
+# One formatter for all nodes; class-based output keeps the HTML small —
+# tokens carry a short class instead of a repeated inline style attribute
+HTML_FORMATTER = HtmlFormatter(full=False)
+HIGHLIGHT_CSS = HTML_FORMATTER.get_style_defs(".highlight")
+
+
+@lru_cache(maxsize=256)
+def highlighted_code_block(info, code):
+    """Highlight a fenced code block, cached across streaming re-renders."""
+    try:
+        lexer = get_lexer_by_name(info) if info else TextLexer()
+    except ClassNotFound:
+        lexer = TextLexer()
+    return highlight(code, lexer, HTML_FORMATTER)
+
+
+_markdown_parser = None
+
+
+def markdown_parser():
+    """Markdown parser shared by every node, imported on first use.
+
+    mistune (like litellm) stays off the import path so application
+    start-up does not pay for dependencies only explanations need.
+    """
+    global _markdown_parser
+    if _markdown_parser is None:
+        import mistune
+
+        class HighlightRenderer(mistune.HTMLRenderer):
+            def block_code(self, code, info=None):
+                return highlighted_code_block(info.strip() if info else "", code)
+
+        _markdown_parser = mistune.create_markdown(
+            renderer=HighlightRenderer(),
+            plugins=["table", "url", "strikethrough", "footnotes", "task_lists"],
+        )
+    return _markdown_parser
+
+
+# On-disk caches survive restarts, so reopening a repository skips the
+# Pygments work entirely for unchanged files
+CACHE_DIR = Path.home() / ".code_compass"
+HIGHLIGHT_CACHE_DIR = CACHE_DIR / "highlight_cache"
+
+# Folded into cache keys so entries are dropped when the output format changes
+HIGHLIGHT_STYLE_TAG = "classes"
+
+
+@lru_cache(maxsize=128)
+def lexer_for_suffix(suffix):
+    """Return a shared lexer for a filename suffix, falling back to plain text.
+
+    get_lexer_for_filename walks Pygments' whole filename registry, so doing
+    it once per extension instead of once per file matters on large folders.
+    """
+    try:
+        return get_lexer_for_filename("x" + suffix)
+    except ClassNotFound:
+        return TextLexer()
+
+
+EXPLAIN_CACHE_FILE = CACHE_DIR / "explain_cache.json"
+_explain_cache = None
+
+
+def content_key(content):
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def explain_cache():
+    """Stored explanations keyed by content hash, loaded once per run.
+
+    Duplicate files share one entry, and entries survive restarts, so
+    repeat content never goes back to the LLM.
+    """
+    global _explain_cache
+    if _explain_cache is None:
+        try:
+            _explain_cache = json.loads(EXPLAIN_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            _explain_cache = {}
+    return _explain_cache
+
+
+def save_explain_cache():
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = EXPLAIN_CACHE_FILE.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(explain_cache()))
+        os.replace(tmp_file, EXPLAIN_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def highlighted_html(filename, text):
+    """Highlight text for display, reusing the on-disk cache when possible."""
+    suffix = Path(filename).suffix.lower() if filename else ""
+    key = hashlib.blake2b(
+        f"{HIGHLIGHT_STYLE_TAG}:{suffix}:{text}".encode(), digest_size=16
+    ).hexdigest()
+    cache_file = HIGHLIGHT_CACHE_DIR / f"{key}.html"
+    try:
+        return cache_file.read_text()
+    except OSError:
+        pass
+
+    lexer = lexer_for_suffix(suffix) if filename else TextLexer()
+    html_content = highlight(text, lexer, HTML_FORMATTER)
+    try:
+        HIGHLIGHT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = HIGHLIGHT_CACHE_DIR / f"{key}.tmp"
+        tmp_file.write_text(html_content)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return html_content
+
+
+@lru_cache(maxsize=8)
+def node_background_pixmap(width, height, color_name):
+    """Shared pre-rendered node background for a given geometry and color.
+
+    Every collapsed node has identical geometry, so the rounded rect is
+    rasterized once here and blitted, instead of once per node.
+    """
+    pixmap = QPixmap(width, height)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QBrush(QColor(color_name)))
+    painter.drawRoundedRect(0, 0, width, height, 10, 10)
+    painter.end()
+    return pixmap
+
+
+def list_files(folder_path):
+    """List regular files in folder_path using os.scandir.
+
+    DirEntry caches the stat result from the directory read, so is_file()
+    does not issue an extra stat per entry the way Path.iterdir/is_file does.
+    Hidden files (.gitignore, .DS_Store, ...) are skipped; they would each
+    cost a full node and read without being code anyone asks about.
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+    except OSError:
+        return []
+
+
+class FileScanSignals(QObject):
+    finished = pyqtSignal(str, list)
+
 
-class ExplanationWorker(QThread):
+class FileScanWorker(QRunnable):
+    """Enumerate a folder on the thread pool so the UI thread never blocks
+    on directory reads (slow on network filesystems or huge folders)."""
+
+    def __init__(self, folder_path):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = FileScanSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.folder_path, list_files(self.folder_path))
+
+
+class ExplanationSignals(QObject):
     chunk_received = pyqtSignal(str)
     finished = pyqtSignal()
 
+
+class ExplanationWorker(QRunnable):
     def __init__(self, code):
         super().__init__()
+        # The label keeps a reference; don't let the pool delete us mid-use
+        self.setAutoDelete(False)
         self.code = code
+        self.signals = ExplanationSignals()
         self.is_running = True  # Flag to control execution
+        self.failed = False  # Set when the stream dies mid-run
 
     def stop(self):
         """Stop the worker"""
@@ -59,11 +306,12 @@ class ExplanationWorker(QThread):
 
     def run(self):
         try:
+            # Deferred import: litellm is heavy and only needed here
+            from litellm import completion
+
             messages = [
-                {
-                    "role": "user",
-                    "content": f"Please explain this code and return response in Markdown:\n\n{self.code}",
-                }
+                {"role": "system", "content": EXPLAIN_SYSTEM_PROMPT},
+                {"role": "user", "content": self.code},
             ]
 
             response = completion(
@@ -71,8 +319,15 @@ class ExplanationWorker(QThread):
                 messages=messages,
                 api_base="http://localhost:11434",
                 stream=True,
+                # Keep the model loaded and its prefix KV cache warm between
+                # nodes so each request only pays for the new code block
+                extra_body={"cache_prompt": True, "keep_alive": "30m"},
             )
 
+            # Tokens arrive every few milliseconds; batch them so the UI
+            # thread gets one queued signal per window, not one per token
+            buffered = []
+            last_emit = time.monotonic()
             for chunk in response:
                 if not self.is_running:
                     break  # Exit if stopped
@@ -80,15 +335,23 @@ class ExplanationWorker(QThread):
                 if "choices" in chunk and len(chunk["choices"]) > 0:
                     delta = chunk["choices"][0].get("delta", {})
                     if "content" in delta:
-                        self.chunk_received.emit(delta["content"])
+                        buffered.append(delta["content"])
+                        now = time.monotonic()
+                        if now - last_emit >= 0.05:
+                            self.signals.chunk_received.emit("".join(buffered))
+                            buffered.clear()
+                            last_emit = now
 
-            self.finished.emit()
+            if buffered:
+                self.signals.chunk_received.emit("".join(buffered))
+            self.signals.finished.emit()
 
         except Exception as e:
+            self.failed = True
             if self.is_running:  # Only emit error if not manually stopped
                 error_md = f"**Error:** {str(e)}"
-                self.chunk_received.emit(error_md)
-            self.finished.emit()
+                self.signals.chunk_received.emit(error_md)
+            self.signals.finished.emit()
 
 
 class ScrollableTextWidget(QWidget):
@@ -96,6 +359,11 @@ class ScrollableTextWidget(QWidget):
         super().__init__(parent)
         self.setMinimumSize(width, height)
 
+        self.filename = filename
+        self.text = text
+        # Highlighting is deferred until the node is first expanded
+        self.is_highlighted = False
+
         # Create layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -105,31 +373,14 @@ class ScrollableTextWidget(QWidget):
 
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.document().setDefaultStyleSheet(HIGHLIGHT_CSS)
 
         self.second_text_edit = QTextEdit()
         self.second_text_edit.setReadOnly(True)
+        self.second_text_edit.document().setDefaultStyleSheet(HIGHLIGHT_CSS)
 
-        try:
-            lexer = get_lexer_for_filename(filename) if filename else TextLexer()
-        except ClassNotFound:
-            lexer = TextLexer()
-
-        formatter = HtmlFormatter(full=False, noclasses=True)
-
-        # Combine filename and text for display
-        html_content = highlight(text, lexer, formatter)
-
-        self.text_edit.setHtml(html_content)
-
-        style = f"""
-            QTextEdit {{
-                border: none;
-                font-family: {FONT.family()};
-                font-size: {FONT.pointSize()}pt;
-            }}
-        """
-        self.text_edit.setStyleSheet(style)
-        self.second_text_edit.setStyleSheet(style)
+        self.text_edit.setStyleSheet(TEXTEDIT_QSS)
+        self.second_text_edit.setStyleSheet(TEXTEDIT_QSS)
 
         # Add text edits to stack layout
         self.stack_layout.addWidget(self.text_edit)
@@ -138,6 +389,13 @@ class ScrollableTextWidget(QWidget):
         # Add stack layout to main layout
         layout.addLayout(self.stack_layout)
 
+    def ensure_highlighted(self):
+        """Render the syntax-highlighted content on first use."""
+        if self.is_highlighted:
+            return
+        self.text_edit.setHtml(highlighted_html(self.filename, self.text))
+        self.is_highlighted = True
+
     def switch_to_second_text_edit(self, content=None):
         """Switch to second text edit and optionally set its content."""
         if content is not None:
@@ -162,43 +420,82 @@ class UIConstants:
     HOVER_SCALE_FACTOR = 1.5
     HOVER_ANIMATION_DURATION = 200  # milliseconds
 
+    # Below this view scale nodes are a few pixels; skip detail painting
+    LOD_PAINT_THRESHOLD = 0.2
+
+    # Shared paint objects; built once instead of per paint call
+    SELECTED_NODE_PEN = QPen(QColor(0, 0, 0), 2)
+    SYMBOL_PEN = QPen(SYMBOL_COLOR, 1.5)
+
+    # One QSS string (and two derived colors) for every explain button
+    EXPLAIN_BUTTON_QSS = f"""
+        QPushButton {{
+            padding: 4px;
+            font-family: {FONT.family()};
+            font-size: {FONT.pointSize()}pt;
+            border: none;
+        }}
+        QPushButton:hover {{
+            background-color: {EXPANDER_COLOR.lighter(150).name()};
+            color: white;
+            border-radius: 8px;
+        }}
+        QPushButton:pressed {{
+            background-color: {EXPANDER_COLOR.darker(150).name()};
+            color: white;
+            border-radius: 8px;
+        }}
+    """
+
 
 class ExpanderCircle(QGraphicsObject):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._scale = 1.0
 
         self.circle_radius = UIConstants.CIRCLE_RADIUS
         self.circle_padding = UIConstants.CIRCLE_PADDING
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.circle_color = UIConstants.EXPANDER_COLOR
+        self.circle_brush = QBrush(self.circle_color)
         self.is_expanded = False
+        # The hover animation only scales the item; blit the cached pixmap
+        self.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)
 
         # Animation setup
         self.scale_animation = QPropertyAnimation(self, b"scale")
         self.scale_animation.setDuration(UIConstants.HOVER_ANIMATION_DURATION)
         self.setTransformOriginPoint(self.circle_radius, self.circle_radius)
 
-    @pyqtProperty(float)
-    def scale(self):
-        return self._scale
-
-    @scale.setter
-    def scale(self, value):
-        self._scale = value
-        self.setScale(value)
+        # Geometry depends only on constants; build it once
+        size = self.circle_radius * 2 + self.circle_padding
+        self._bounding_rect = QRectF(0, 0, size, size)
+        center = self.circle_padding + self.circle_radius
+        offset = self.circle_radius * 1.2 / 2
+        self.h_line = (
+            QPointF(center - offset, center),
+            QPointF(center + offset, center),
+        )
+        self.v_line = (
+            QPointF(center, center - offset),
+            QPointF(center, center + offset),
+        )
 
     def hoverEnterEvent(self, event):
-        self.scale_animation.setStartValue(1.0)
-        self.scale_animation.setEndValue(UIConstants.HOVER_SCALE_FACTOR)
-        self.scale_animation.start()
+        # Already at (or animating from) the hover size; nothing to animate
+        if self.scale() < UIConstants.HOVER_SCALE_FACTOR - 1e-3:
+            self.scale_animation.stop()
+            self.scale_animation.setStartValue(self.scale())
+            self.scale_animation.setEndValue(UIConstants.HOVER_SCALE_FACTOR)
+            self.scale_animation.start()
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
-        self.scale_animation.setStartValue(UIConstants.HOVER_SCALE_FACTOR)
-        self.scale_animation.setEndValue(1.0)
-        self.scale_animation.start()
+        if self.scale() > 1.0 + 1e-3:
+            self.scale_animation.stop()
+            self.scale_animation.setStartValue(self.scale())
+            self.scale_animation.setEndValue(1.0)
+            self.scale_animation.start()
         super().hoverLeaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -211,48 +508,66 @@ class ExpanderCircle(QGraphicsObject):
             event.ignore()
 
     def boundingRect(self):
-        return QRectF(
-            0,
-            0,
-            self.circle_radius * 2 + self.circle_padding,
-            self.circle_radius * 2 + self.circle_padding,
-        )
+        return self._bounding_rect
 
     def toggle_expanded(self):
         self.is_expanded = not self.is_expanded
         self.update()  # Trigger repaint
 
     def paint(self, painter, option, widget):
+        # Bind hot attributes to locals; paint runs every animation frame
+        radius = self.circle_radius
+        padding = self.circle_padding
+
         # Draw the circle
-        painter.setBrush(QBrush(self.circle_color))
+        painter.setBrush(self.circle_brush)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(
-            self.circle_padding,
-            self.circle_padding,
-            self.circle_radius * 2,
-            self.circle_radius * 2,
-        )
-
-        # Draw the plus/minus symbol
-        painter.setPen(QPen(UIConstants.SYMBOL_COLOR, 1.5))
+        painter.drawEllipse(padding, padding, radius * 2, radius * 2)
 
-        # Calculate symbol dimensions
-        symbol_size = self.circle_radius * 1.2  # Size of the symbol
-        center_x = self.circle_padding + self.circle_radius
-        center_y = self.circle_padding + self.circle_radius
-        offset = symbol_size / 2
-
-        # Draw horizontal line using QPointF
-        painter.drawLine(
-            QPointF(center_x - offset, center_y), QPointF(center_x + offset, center_y)
-        )
+        # Draw the plus/minus symbol from the precomputed endpoints
+        painter.setPen(UIConstants.SYMBOL_PEN)
+        painter.drawLine(*self.h_line)
 
         # Draw vertical line (only if expanded)
         if not self.is_expanded:
-            painter.drawLine(
-                QPointF(center_x, center_y - offset),
-                QPointF(center_x, center_y + offset),
-            )
+            painter.drawLine(*self.v_line)
+
+
+class GlowDriver:
+    """Single shared timer driving the glow pulse for all explaining labels.
+
+    One tick updates every registered label, instead of each label looping
+    its own QPropertyAnimation and waking the event loop separately.
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.widgets = weakref.WeakSet()
+        self.timer = QTimer()
+        self.timer.setInterval(16)
+        self.timer.timeout.connect(self.tick)
+
+    def add(self, widget):
+        self.widgets.add(widget)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def remove(self, widget):
+        self.widgets.discard(widget)
+        if not self.widgets:
+            self.timer.stop()
+
+    def tick(self):
+        intensity = time.monotonic() % 1.0
+        for widget in list(self.widgets):
+            widget.glow_intensity = intensity
 
 
 class FilenameLabelWidget(QGraphicsObject):
@@ -262,10 +577,20 @@ class FilenameLabelWidget(QGraphicsObject):
         super().__init__(parent)
 
         self.text = ""
+        # Glyph layout is done once per text change, not per paint
+        self.static_text = QStaticText("")
         self.padding = 5
         self.height = 25
         self.font = FONT
+        # The parent node's width never changes; cache the rect instead of
+        # re-deriving it from the parent on every paint and hit-test
+        self._bounding_rect = QRectF(
+            10, 0, parent.boundingRect().width() - 20, self.height
+        )
         self.text_color = Qt.GlobalColor.black
+        # Where drawStaticText starts; depends only on the fixed label rect
+        # and the laid-out text size, so recomputed in set_text, not paint
+        self._text_pos = QPointF(10 + self.padding, 0)
         self.drag_start_pos = None
         self.is_showing_explanation = False
         self._glow_intensity = 0.0
@@ -274,26 +599,10 @@ class FilenameLabelWidget(QGraphicsObject):
         # Enable mouse tracking and set cursor
         self.setAcceptHoverEvents(True)
         self.setCursor(Qt.CursorShape.SizeAllCursor)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         self.explain_button = QPushButton("Explain")
-        self.explain_button.setStyleSheet(f"""
-            QPushButton {{
-                padding: 4px;
-                font-family: {FONT.family()};
-                font-size: {FONT.pointSize()}pt;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {UIConstants.EXPANDER_COLOR.lighter(150).name()};
-                color: white;
-                border-radius: 8px;
-            }}
-            QPushButton:pressed {{
-                background-color: {UIConstants.EXPANDER_COLOR.darker(150).name()};
-                color: white;
-                border-radius: 8px;
-            }}
-        """)
+        self.explain_button.setStyleSheet(UIConstants.EXPLAIN_BUTTON_QSS)
         self.explain_button.clicked.connect(self.on_explain_clicked)
 
         # Embed the button into the QGraphicsObject using QGraphicsProxyWidget
@@ -301,6 +610,9 @@ class FilenameLabelWidget(QGraphicsObject):
         self.proxy_widget.setWidget(self.explain_button)
         self.proxy_widget.widget().show()
 
+        # sizeHint walks the style/font metrics; cache it for repositioning
+        self.button_size = self.explain_button.sizeHint()
+
         # Position the button to the right edge of the label
         self.update_button_position()
 
@@ -308,26 +620,39 @@ class FilenameLabelWidget(QGraphicsObject):
         self.explain_button.setEnabled(True)
         self.accumulated_markdown = ""
 
-        # Initialize mark down parser
-        self.markdown = mistune.create_markdown(
-            plugins=["table", "url", "strikethrough", "footnotes", "task_lists"]
-        )
         self.is_worker_running = False
         self.is_currently_explaining = False
         self.glow_color = QColor(255, 140, 0)
 
-        # Animation for the glow effect
-        self.glow_animation = QPropertyAnimation(self, b"glow_intensity")
-        self.glow_animation.setDuration(1000)  # 1 second
-        self.glow_animation.setStartValue(0.0)
-        self.glow_animation.setEndValue(1.0)
-        self.glow_animation.setLoopCount(-1)  # Infinite loop
+        # Reused across paints; only the glow pens' color alpha changes
+        self.text_pen = QPen(self.text_color)
+        self.glow_pens = tuple(QPen(self.glow_color, 2 + i * 2) for i in range(3))
+
+        # Coalesce streamed chunks; re-rendering per token is quadratic in
+        # the length of the explanation
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(50)
+        self.render_timer.timeout.connect(self.flush_markdown)
+
+        # Markdown before stable_upto is already in the document and never
+        # re-rendered; only the tail after stable_doc_pos gets replaced
+        self.stable_upto = 0
+        self.stable_doc_pos = 0
+
+    @property
+    def markdown(self):
+        return markdown_parser()
 
     def stop_explanation(self):
         """Stop the current explanation if running"""
         if self.explanation_worker and self.is_worker_running:
             self.explanation_worker.stop()
-            self.explanation_worker.wait()  # Wait for the thread to finish
+            # With autoDelete off, Python owns the runnable; a worker still
+            # queued behind busy pool threads must leave the queue before
+            # the last reference is dropped below, or the pool would later
+            # dequeue a deleted object
+            QThreadPool.globalInstance().tryTake(self.explanation_worker)
             self.handle_explanation_finished()
             self.accumulated_markdown += "\n\n*Explanation interrupted.*"
             html_content = self.markdown(self.accumulated_markdown)
@@ -349,9 +674,7 @@ class FilenameLabelWidget(QGraphicsObject):
         self.update()
 
     def boundingRect(self):
-        # Define the bounding rectangle for the label widget
-        width = self.parentItem().boundingRect().width() - 20
-        return QRectF(0 + 10, 0, width, self.height)
+        return self._bounding_rect
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -378,12 +701,14 @@ class FilenameLabelWidget(QGraphicsObject):
             event.ignore()
 
     def paint(self, painter, option, widget):
-        # Save the painter state
-        painter.save()
+        # Too small to read; the parent node already painted a backdrop
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < UIConstants.LOD_PAINT_THRESHOLD:
+            return
 
-        # Use the same background color and alpha as the parent node
-        parent_color = self.parentItem().background_color
-        painter.setBrush(QBrush(parent_color))
+        # Use the same background brush as the parent node; the view saves
+        # and restores painter state between items, so no save() needed here
+        painter.setBrush(self.parentItem().background_brush)
 
         if self.is_worker_running:
             # Create glowing border effect
@@ -391,8 +716,8 @@ class FilenameLabelWidget(QGraphicsObject):
             glow_color.setAlphaF(0.5 * self._glow_intensity)
 
             # Draw multiple glowing borders with decreasing alpha
-            for i in range(3):
-                pen = QPen(glow_color, 2 + i * 2)
+            for i, pen in enumerate(self.glow_pens):
+                pen.setColor(glow_color)
                 painter.setPen(pen)
                 painter.drawRoundedRect(
                     self.boundingRect().adjusted(i, i, -i, -i), 5, 5
@@ -401,23 +726,15 @@ class FilenameLabelWidget(QGraphicsObject):
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawRoundedRect(self.boundingRect(), 5, 5)
 
-        # Draw the text
-        painter.setPen(QPen(self.text_color))
+        # Draw the pre-laid-out text at its precomputed position
+        painter.setPen(self.text_pen)
         painter.setFont(self.font)
-        text_rect = self.boundingRect().adjusted(self.padding, 0, -self.padding, 0)
-        painter.drawText(
-            text_rect,
-            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
-            self.text,
-        )
-
-        # Restore the painter state
-        painter.restore()
+        painter.drawStaticText(self._text_pos, self.static_text)
 
     def update_button_position(self):
         # Position the button at the right edge of the label
-        button_width = self.explain_button.sizeHint().width()
-        button_height = self.explain_button.sizeHint().height()
+        button_width = self.button_size.width()
+        button_height = self.button_size.height()
         button_x = self.boundingRect().width() - button_width
         button_y = (self.boundingRect().height() - button_height) / 2
 
@@ -444,9 +761,14 @@ class FilenameLabelWidget(QGraphicsObject):
 
                 parent_node.text_widget.switch_to_second_text_edit("")
                 if (
-                    self.accumulated_markdown
-                    and "Explanation interrupted" not in self.accumulated_markdown
+                    not self.accumulated_markdown
+                    or "Explanation interrupted" in self.accumulated_markdown
                 ):
+                    # A duplicate of this file may already be explained
+                    self.accumulated_markdown = explain_cache().get(
+                        content_key(parent_node.content), ""
+                    )
+                if self.accumulated_markdown:
                     html_content = self.markdown(self.accumulated_markdown)
                     parent_node.text_widget.second_text_edit.setHtml(html_content)
                     self.explain_button.setText("Code")
@@ -455,7 +777,10 @@ class FilenameLabelWidget(QGraphicsObject):
                 else:
                     # Start glow effect
                     self.is_worker_running = True
-                    self.glow_animation.start()
+                    GlowDriver.instance().add(self)
+                    scene = parent_node.scene()
+                    if scene and scene.views():
+                        scene.views()[0]._active_worker_node = parent_node
 
                     # Disable button during API call
                     self.explain_button.setEnabled(False)
@@ -463,17 +788,19 @@ class FilenameLabelWidget(QGraphicsObject):
 
                     # Clear previous text and switch to second text edit
                     self.accumulated_markdown = ""
+                    self.stable_upto = 0
+                    self.stable_doc_pos = 0
                     self.explain_button.hide()
 
-                    # Create and start worker thread
+                    # Create the worker and hand it to the shared pool
                     self.explanation_worker = ExplanationWorker(parent_node.content)
-                    self.explanation_worker.chunk_received.connect(
+                    self.explanation_worker.signals.chunk_received.connect(
                         self.handle_chunk_received
                     )
-                    self.explanation_worker.finished.connect(
+                    self.explanation_worker.signals.finished.connect(
                         self.handle_explanation_finished
                     )
-                    self.explanation_worker.start()
+                    QThreadPool.globalInstance().start(self.explanation_worker)
             else:
                 # Switch back to code view
                 parent_node.text_widget.switch_to_first_text_edit()
@@ -481,25 +808,124 @@ class FilenameLabelWidget(QGraphicsObject):
                 self.is_showing_explanation = False
 
     def handle_chunk_received(self, chunk):
+        # Accumulate text; rendering happens once per timer window
+        self.accumulated_markdown += chunk
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def stable_boundary(self):
+        """Markdown index up to which blocks can be rendered permanently.
+
+        A paragraph break only qualifies when it is not inside an unclosed
+        fenced code block.
+        """
+        text = self.accumulated_markdown
+        idx = text.rfind("\n\n")
+        while idx != -1:
+            if text.count("```", 0, idx) % 2 == 0:
+                return idx + 2
+            idx = text.rfind("\n\n", 0, idx)
+        return 0
+
+    @staticmethod
+    def insert_html_fragment(cursor, html):
+        """Insert html into its own block at the cursor.
+
+        insertHtml alone merges the fragment's first block into the block
+        under the cursor, gluing paragraphs together and bleeding formats
+        (e.g. a heading's bold) into the appended text.
+        """
+        if not cursor.atBlockStart() or cursor.block().length() > 1:
+            cursor.insertBlock()
+        cursor.insertHtml(html)
+
+    def flush_markdown(self):
+        # A queued flush can fire after stop_explanation rebuilt the
+        # document; stable_doc_pos is stale then, so do nothing
+        if not self.is_worker_running:
+            return
         parent_node = self.parentItem()
-        if parent_node and hasattr(parent_node, "text_widget"):
-            # Accumulate text and update display
-            self.accumulated_markdown += chunk
-            html_content = self.markdown(self.accumulated_markdown)
-            parent_node.text_widget.second_text_edit.setHtml(html_content)
+        if not (parent_node and hasattr(parent_node, "text_widget")):
+            return
+        text_edit = parent_node.text_widget.second_text_edit
+
+        # Only follow the stream if the user hasn't scrolled up to read
+        scrollbar = text_edit.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        # Drop the previously rendered volatile tail, then append instead of
+        # rebuilding the whole document with setHtml
+        cursor = text_edit.textCursor()
+        cursor.setPosition(min(self.stable_doc_pos, len(text_edit.toPlainText())))
+        cursor.movePosition(
+            QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor
+        )
+        cursor.removeSelectedText()
+
+        boundary = self.stable_boundary()
+        if boundary > self.stable_upto:
+            self.insert_html_fragment(
+                cursor,
+                self.markdown(self.accumulated_markdown[self.stable_upto : boundary]),
+            )
+            self.stable_upto = boundary
+            self.stable_doc_pos = cursor.position()
 
-            # Scroll to the bottom to show new content
-            scrollbar = parent_node.text_widget.second_text_edit.verticalScrollBar()
+        tail = self.accumulated_markdown[self.stable_upto :]
+        if tail:
+            self.insert_html_fragment(cursor, self.markdown(tail))
+
+        # Scroll to the bottom to show new content
+        if was_at_bottom:
             scrollbar.setValue(scrollbar.maximum())
 
     def set_text(self, text):
+        if text == self.text:
+            return
         self.text = text
+        self.static_text = QStaticText(text)
+        self.static_text.prepare(QTransform(), self.font)
+        text_rect = self._bounding_rect.adjusted(self.padding, 0, -self.padding, 0)
+        text_top = (
+            text_rect.top()
+            + (text_rect.height() - self.static_text.size().height()) / 2
+        )
+        self._text_pos = QPointF(text_rect.left(), text_top)
         self.update()
 
     def handle_explanation_finished(self):
+        # stop_explanation tears the run down synchronously; the worker's
+        # queued finished signal still arrives afterwards and must not
+        # flush against the rebuilt document
+        if not self.is_worker_running:
+            return
+
+        # Render whatever is still pending before tearing down
+        self.render_timer.stop()
+        self.flush_markdown()
+
+        # Persist completed explanations; skip stopped or failed runs
+        parent_node = self.parentItem()
+        if (
+            parent_node
+            and self.accumulated_markdown
+            and self.explanation_worker
+            and self.explanation_worker.is_running
+            and not self.explanation_worker.failed
+        ):
+            explain_cache()[content_key(parent_node.content)] = (
+                self.accumulated_markdown
+            )
+            save_explain_cache()
+
         # Stop glow effect
         self.is_worker_running = False
-        self.glow_animation.stop()
+        scene = parent_node.scene() if parent_node else None
+        if scene and scene.views():
+            view = scene.views()[0]
+            if view._active_worker_node is parent_node:
+                view._active_worker_node = None
+        GlowDriver.instance().remove(self)
         self._glow_intensity = 0.0
         self.update()
 
@@ -509,10 +935,8 @@ class FilenameLabelWidget(QGraphicsObject):
         self.is_showing_explanation = True
         self.explanation_worker_finished.emit()
 
-        # Clean up worker
-        if self.explanation_worker:
-            self.explanation_worker.deleteLater()
-            self.explanation_worker = None
+        # Drop the worker reference; the wrapper is collected once idle
+        self.explanation_worker = None
 
     def set_geometry(self, rect):
         # Update geometry and reposition the button
@@ -525,6 +949,8 @@ class TextNodeItem(QGraphicsObject):
         super().__init__(parent)
 
         self.filename = filename
+        # Resolving the absolute path stats the filesystem; do it once
+        self.abs_path = str(Path(filename).absolute())
         self.content = content
         self.min_width = width
         self.min_height = height
@@ -535,6 +961,8 @@ class TextNodeItem(QGraphicsObject):
         self.is_expanded = False
 
         self._current_height = self.collapsed_height
+        # Rebuilt only on height changes; boundingRect is hit constantly
+        self._bounding_rect = QRectF(0, 0, self.expanded_width, self._current_height)
 
         # Create scrollable text widget
         self.text_widget = ScrollableTextWidget(
@@ -551,33 +979,46 @@ class TextNodeItem(QGraphicsObject):
         self.proxy.setVisible(False)
 
         self.background_color = QColor(background_color)
+        self.background_brush = QBrush(self.background_color)
 
         # Create filename label
         self.filename_label = FilenameLabelWidget(self)
         # Initially show the full path
-        self.filename_label.set_text(str(Path(filename).absolute()))
+        self.filename_label.set_text(self.abs_path)
 
         # Rest of the initialization code remains the same
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
-        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # Item-space caching survives zoom changes; the pixmap is rescaled
+        # instead of re-rasterized on every zoom step
+        self.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)
 
         self.animation = QPropertyAnimation(self, b"currentHeight")
         self.animation.setDuration(300)
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # Caching during the animation would re-rasterize the pixmap every
+        # frame; paint directly until the height settles
+        self.animation.finished.connect(self._restore_cache_mode)
 
         self.expander = ExpanderCircle(self)
 
         self.update_circle_position()
 
+    def _restore_cache_mode(self):
+        self.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache)
+
     def get_current_height(self):
         return self._current_height
 
     def set_current_height(self, height):
         self.prepareGeometryChange()
         self._current_height = height
+        self._bounding_rect = QRectF(0, 0, self.expanded_width, height)
         self.update_circle_position()
+        if self.scene():
+            for view in self.scene().views():
+                view.invalidate_bounds()
         self.update()
 
     currentHeight = pyqtProperty(
@@ -593,17 +1034,25 @@ class TextNodeItem(QGraphicsObject):
         self.expander.is_expanded = expanded
         self.expander.update()  # Force a repaint of the expander
 
+        if expanded:
+            self.text_widget.ensure_highlighted()
         self.proxy.setVisible(expanded)
 
-        # Update the label text based on state
-        self.filename_label.set_text(str(Path(self.filename).absolute()))
+        # The label always shows the absolute path; only its position
+        # depends on the expanded state
         self.filename_label.setPos(0, -self.filename_label.height - 5)
 
         # Determine target height
         target_height = self.expanded_height if expanded else self.collapsed_height
 
-        # Start animation
+        # Nothing to animate when the height is already at the target
         self.animation.stop()
+        if abs(self._current_height - target_height) < 0.5:
+            self.set_current_height(target_height)
+            return
+
+        # Start animation
+        self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
         self.animation.setStartValue(self._current_height)
         self.animation.setEndValue(target_height)
         self.animation.start()
@@ -641,12 +1090,37 @@ class TextNodeItem(QGraphicsObject):
             )
 
     def paint(self, painter, option, widget):
+        # Nothing to do when the dirty region misses this node
+        if not option.exposedRect.intersects(self.boundingRect()):
+            return
+
         # Draw background
-        painter.setBrush(QBrush(self.background_color))
+        painter.setBrush(self.background_brush)
+
+        # At tiny scales a flat rectangle is all that is visible
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < UIConstants.LOD_PAINT_THRESHOLD:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRect(self.boundingRect())
+            return
+
+        # Collapsed unselected nodes all look alike; blit the shared
+        # pre-rendered background instead of re-rasterizing the rounded rect
+        if not self.isSelected() and self._current_height == self.collapsed_height:
+            painter.drawPixmap(
+                0,
+                0,
+                node_background_pixmap(
+                    int(self.expanded_width),
+                    int(self.collapsed_height),
+                    self.background_color.name(),
+                ),
+            )
+            return
 
         # Change the pen based on selection state
         if self.isSelected():
-            painter.setPen(QPen(Qt.GlobalColor.black, 2))
+            painter.setPen(UIConstants.SELECTED_NODE_PEN)
         else:
             painter.setPen(Qt.PenStyle.NoPen)
 
@@ -654,19 +1128,24 @@ class TextNodeItem(QGraphicsObject):
         painter.drawRoundedRect(self.boundingRect(), 10, 10)
 
     def boundingRect(self):
-        return QRectF(0, 0, self.expanded_width, self._current_height)
+        return self._bounding_rect
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
+            # Qt marks the affected regions dirty itself; only the cached
+            # view bounds need refreshing here
             if self.scene():
-                self.scene().update()
+                for view in self.scene().views():
+                    view.invalidate_bounds()
         return super().itemChange(change, value)
 
 
 class ClusterDiagramWidget(QGraphicsView):
     def __init__(self, file_paths, parent=None):
         super().__init__(parent)
-        self.file_paths = [Path(path) for path in file_paths]
+        # Plain strings throughout; open() and os.path take them directly,
+        # so there is no need to allocate a Path per file
+        self.file_paths = list(file_paths)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Set up the scene
@@ -682,22 +1161,72 @@ class ClusterDiagramWidget(QGraphicsView):
         # Enable rubberband selection
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
 
-        # Set viewport update mode
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # Opt-in GPU rasterization; a GL viewport needs full redraws, so the
+        # dirty-region strategy below only applies to the raster backend
+        self._use_gl = bool(os.environ.get("CODE_COMPASS_GL"))
+        if self._use_gl:
+            from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
+        else:
+            # Repaint only the dirty regions instead of the whole viewport
+            self.setViewportUpdateMode(
+                QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+            )
 
         # Set zoom parameters
         self.zoom_factor = 1.15
         self.min_zoom = 0.1
         self.max_zoom = 10.0
 
+        # Cached transform scale; querying transform().m11() copies a
+        # QTransform per call, so track the float ourselves instead
+        self._current_scale = 1.0
+
         # Variable to track pan mode
         self.panning = False
         self.last_mouse_pos = None
 
+        # Mouse moves arrive faster than frames are drawn; accumulate pan
+        # deltas and apply them as one scroll step per timer tick
+        self._pending_delta = QPoint(0, 0)
+        self._pan_timer = QTimer(self)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(8)
+        self._pan_timer.timeout.connect(self._apply_pan)
+
+        # Held zoom keys auto-repeat ~30 Hz; multiply the factors together
+        # and install one scale per frame instead of one per key event
+        self._zoom_accum = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Node geometry shared by initial build and incremental updates
+        self.node_width = 600
+        self.node_height = 400
+
+        # Nodes removed by an update are parked here (keyed by filename) so
+        # a file that reappears gets its fully built node back for free;
+        # OrderedDict gives O(1) eviction of the oldest entry
+        self.node_pool = OrderedDict()
+        self.node_pool_limit = 50
+
+        # Cached union of item bounds; dropped whenever items move or change
+        self._items_bounds = None
+
         # Add method to access nodes
         self.current_explanation_index = 0
         self.previous_node = None
 
+        # Node whose explanation worker is currently running, so stopping
+        # never has to scan every node looking for it
+        self._active_worker_node = None
+
         # Create and display the file nodes
         self.nodes = []
         self.display_file_nodes()
@@ -708,6 +1237,12 @@ class ClusterDiagramWidget(QGraphicsView):
         # Initialize scrollbars
         self.adjust_scroll_bars()
 
+        # Coalesce bursts of resize events into a single re-fit
+        self.refit_timer = QTimer(self)
+        self.refit_timer.setSingleShot(True)
+        self.refit_timer.setInterval(150)
+        self.refit_timer.timeout.connect(self.fit_in_view)
+
         # Set up keyboard shortcuts
         self.setup_shortcuts()
 
@@ -744,8 +1279,18 @@ class ClusterDiagramWidget(QGraphicsView):
             self.clear_previous_highlight()
             return False
 
+    def invalidate_bounds(self):
+        """Drop the cached item bounds (called when items move or resize)."""
+        self._items_bounds = None
+
+    def items_bounds(self):
+        """Union of all item bounds, recomputed only after scene changes."""
+        if self._items_bounds is None:
+            self._items_bounds = self.scene.itemsBoundingRect()
+        return QRectF(self._items_bounds)
+
     def adjust_scroll_bars(self):
-        current_scale = self.transform().m11()
+        current_scale = self._current_scale
 
         # Adjust scrollbar step sizes based on zoom level
         self.verticalScrollBar().setSingleStep(max(1, int(20 / current_scale)))
@@ -753,7 +1298,7 @@ class ClusterDiagramWidget(QGraphicsView):
 
         # Update scene rect to ensure proper scrolling
         visible_rect = self.mapToScene(self.viewport().rect()).boundingRect()
-        scene_rect = self.scene.itemsBoundingRect()
+        scene_rect = self.items_bounds()
 
         # Add some padding around the items
         padding = 100
@@ -763,45 +1308,135 @@ class ClusterDiagramWidget(QGraphicsView):
         scene_rect = scene_rect.united(visible_rect)
         self.scene.setSceneRect(scene_rect)
 
-    def display_file_nodes(self):
-        import math
+    def read_file_content(self, file_path):
+        """Read a file for display, skipping non-text extensions."""
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix and suffix not in TEXT_EXTENSIONS:
+            return f"Skipped non-text file ({suffix})"
+        try:
+            with open(file_path, "rb") as file:
+                # Ask the kernel to prefetch; not available on macOS
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                data = file.read(MAX_DISPLAY_CHARS)
+                truncated = bool(file.read(1))
+            content = data.decode("utf-8", errors="replace")
+            if truncated:
+                content += "\n\n... (truncated for display)"
+            return content
+        except Exception as e:
+            return f"Error reading file: {str(e)}"
+
+    def create_node(self, file_path, content=None):
+        if content is None:
+            content = self.read_file_content(file_path)
+        node = TextNodeItem(
+            filename=file_path,
+            content=content,
+            width=self.node_width,
+            height=self.node_height,
+            background_color="#E8E8E8",
+        )
+        self.scene.addItem(node)
+        self.invalidate_bounds()
+        return node
+
+    def position_nodes(self):
+        """Lay out all nodes on a circle around the origin."""
+        if not self.nodes:
+            return
+
+        # A lone node needs no ring: centre it on the origin directly
+        if len(self.nodes) == 1:
+            self.nodes[0].setPos(-self.node_width / 2, -self.node_height / 2)
+            self.invalidate_bounds()
+            return
 
         center_x = 0
         center_y = 0
-        node_width = 600
-        radius = self.calculate_radius(
-            len(self.file_paths), node_width
-        )  # Adjust based on number of nodes
-        node_height = 400
-
-        for i, file_path in enumerate(self.file_paths):
-            try:
-                with open(file_path) as file:
-                    content = file.read()
-            except Exception as e:
-                content = f"Error reading file: {str(e)}"
-
-            # Calculate position on circle
-            angle = (2 * math.pi * i) / len(self.file_paths)
-            x_position = center_x + radius * math.cos(angle) - node_width / 2
-            y_position = center_y + radius * math.sin(angle) - node_height / 2
-
-            node = TextNodeItem(
-                filename=str(file_path),
-                content=content,
-                width=node_width,
-                height=node_height,
-                background_color="#E8E8E8",
-            )
+        radius = self.calculate_radius(len(self.nodes), self.node_width)
 
-            self.scene.addItem(node)
+        # Compute all circle positions in one vectorized pass
+        angles = (2 * math.pi * np.arange(len(self.nodes))) / len(self.nodes)
+        x_positions = center_x + radius * np.cos(angles) - self.node_width / 2
+        y_positions = center_y + radius * np.sin(angles) - self.node_height / 2
+
+        for node, x_position, y_position in zip(self.nodes, x_positions, y_positions):
             node.setPos(x_position, y_position)
-            self.nodes.append(node)
+        self.invalidate_bounds()
+
+    def pool_node(self, filename, node):
+        """Park a removed node for potential reuse, evicting the oldest."""
+        if len(self.node_pool) >= self.node_pool_limit:
+            _, oldest_node = self.node_pool.popitem(last=False)
+            oldest_node.deleteLater()
+        self.node_pool[filename] = node
+
+    def take_pooled_node(self, filename):
+        """Return a pooled node for filename back onto the scene, if any."""
+        node = self.node_pool.pop(filename, None)
+        if node is not None:
+            self.scene.addItem(node)
+            self.invalidate_bounds()
+        return node
+
+    def display_file_nodes(self):
+        if not self.file_paths:
+            return
+
+        # Don't rebuild the BSP index or repaint on every insertion during
+        # the bulk add; one update at the end covers all of them
+        self.setUpdatesEnabled(False)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            # Fan out the disk reads; node construction stays on the UI thread
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                contents = executor.map(self.read_file_content, self.file_paths)
+                for file_path, content in zip(self.file_paths, contents):
+                    self.nodes.append(self.create_node(file_path, content))
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+            self.setUpdatesEnabled(True)
+        self.position_nodes()
+
+    def update_file_paths(self, file_paths):
+        """Incrementally sync the scene with a new list of file paths.
+
+        Nodes for files still present are reused; only nodes for added
+        files are created and nodes for removed files destroyed, instead
+        of tearing down and rebuilding the whole scene.
+        """
+        new_paths = list(file_paths)
+        new_keys = set(new_paths)
+        existing = {node.filename: node for node in self.nodes}
+
+        # Same file set means same topology; skip the rebuild entirely
+        if new_keys == set(existing):
+            return
+
+        for filename, node in existing.items():
+            if filename not in new_keys:
+                self.scene.removeItem(node)
+                self.pool_node(filename, node)
+
+        self.file_paths = new_paths
+        self.nodes = [
+            existing.get(path) or self.take_pooled_node(path) or self.create_node(path)
+            for path in new_paths
+        ]
+        self.position_nodes()
+
+        # Explanation cursor is no longer meaningful against the new set
+        self.current_explanation_index = 0
+        self.previous_node = None
+
+        self.fit_in_view()
+        self.adjust_scroll_bars()
 
     def fit_in_view(self):
         # Add padding around the items
         padding = 50
-        scene_rect = self.scene.itemsBoundingRect()
+        scene_rect = self.items_bounds()
         scene_rect.adjust(-padding, -padding, padding, padding)
 
         # Fit the scene in the viewport
@@ -821,14 +1456,15 @@ class ClusterDiagramWidget(QGraphicsView):
         # Apply the transformation
         self.resetTransform()
         self.scale(scale_factor, scale_factor)
+        self._current_scale = scale_factor
 
         # Center the scene
         self.centerOn(scene_rect.center())
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        # Re-fit the view when the window is resized
-        self.fit_in_view()
+        # Re-fit the view once the resize burst settles instead of per event
+        self.refit_timer.start()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Plus or event.key() == Qt.Key.Key_Equal:
@@ -852,6 +1488,16 @@ class ClusterDiagramWidget(QGraphicsView):
             self.last_mouse_pos = event.pos()
             event.accept()
         else:
+            if (
+                not self._use_gl
+                and event.button() == Qt.MouseButton.LeftButton
+                and self.dragMode() == QGraphicsView.DragMode.RubberBandDrag
+            ):
+                # The rubber band invalidates large regions every mouse-move;
+                # full updates are cheaper than minimal-region bookkeeping here
+                self.setViewportUpdateMode(
+                    QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+                )
             # Store the start position for rubber band selection
             self.rubber_band_start = event.pos()
             super().mousePressEvent(event)
@@ -864,9 +1510,21 @@ class ClusterDiagramWidget(QGraphicsView):
             event.button() == Qt.MouseButton.LeftButton
             and self.dragMode() == QGraphicsView.DragMode.RubberBandDrag
         ):
+            # Back to dirty-region-only repaints now the rubber band is gone
+            if not self._use_gl:
+                self.setViewportUpdateMode(
+                    QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate
+                )
             # Get the rubber band selection rectangle
             rubber_band_rect = self.rubberBandRect()
-            if rubber_band_rect and not rubber_band_rect.isEmpty():
+            # A few-pixel drag is a misclick, not a zoom request; judge the
+            # raw viewport rectangle before padding inflates it
+            min_drag = QApplication.startDragDistance()
+            if (
+                rubber_band_rect
+                and rubber_band_rect.width() >= min_drag
+                and rubber_band_rect.height() >= min_drag
+            ):
                 # Convert viewport coordinates to scene coordinates
                 scene_rect = self.mapToScene(rubber_band_rect).boundingRect()
                 # Add some padding around the selection
@@ -878,22 +1536,24 @@ class ClusterDiagramWidget(QGraphicsView):
         super().mouseReleaseEvent(event)
 
     def zoom_to_rect(self, rect):
-        # Store the current centerpoint
-        self.mapToScene(self.viewport().rect().center())
-
-        # Fit the rect in the viewport
-        self.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+        # Compute the clamped scale analytically and install one transform,
+        # instead of fitInView followed by a reset-and-rescale correction
+        viewport_rect = self.viewport().rect()
+        new_scale = min(
+            viewport_rect.width() / rect.width(),
+            viewport_rect.height() / rect.height(),
+        )
+        new_scale = max(self.min_zoom, min(self.max_zoom, new_scale))
 
-        # Get the new scale factor
-        new_scale = self.transform().m11()
+        # Same scale means this is really a pan; skip the transform install
+        if abs(new_scale - self._current_scale) < 1e-6:
+            self.centerOn(rect.center())
+            return
 
-        # Check if we exceed zoom limits
-        if new_scale > self.max_zoom:
-            self.resetTransform()
-            self.scale(self.max_zoom, self.max_zoom)
-        elif new_scale < self.min_zoom:
-            self.resetTransform()
-            self.scale(self.min_zoom, self.min_zoom)
+        transform = QTransform()
+        transform.scale(new_scale, new_scale)
+        self.setTransform(transform)
+        self._current_scale = new_scale
 
         # Center on the selection
         self.centerOn(rect.center())
@@ -903,33 +1563,47 @@ class ClusterDiagramWidget(QGraphicsView):
 
     def mouseMoveEvent(self, event):
         if self.panning and self.last_mouse_pos is not None:
-            delta = event.pos() - self.last_mouse_pos
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - delta.x()
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - delta.y()
-            )
+            self._pending_delta += event.pos() - self.last_mouse_pos
             self.last_mouse_pos = event.pos()
+            if not self._pan_timer.isActive():
+                self._pan_timer.start()
+        # Scrollbar updates happen in _apply_pan and already schedule the
+        # needed repaint; no extra full-viewport update per mouse-move
         super().mouseMoveEvent(event)
-        self.viewport().update()
+
+    def _apply_pan(self):
+        """Apply the pan delta accumulated since the last timer tick."""
+        delta = self._pending_delta
+        self._pending_delta = QPoint(0, 0)
+        self.horizontalScrollBar().setValue(
+            self.horizontalScrollBar().value() - delta.x()
+        )
+        self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
 
     def zoom_in(self):
-        self.scale_view(self.zoom_factor)
+        self._zoom_accum *= self.zoom_factor
+        self._schedule_zoom()
 
     def zoom_out(self):
-        self.scale_view(1 / self.zoom_factor)
+        self._zoom_accum /= self.zoom_factor
+        self._schedule_zoom()
 
-    def scale_view(self, factor):
-        current_scale = self.transform().m11()
-        new_scale = current_scale * factor
+    def _schedule_zoom(self):
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
 
-        if new_scale > self.max_zoom:
-            factor = self.max_zoom / current_scale
-        elif new_scale < self.min_zoom:
-            factor = self.min_zoom / current_scale
+    def _apply_zoom(self):
+        """Install the zoom factor accumulated over the last frame."""
+        self.scale_view(self._zoom_accum)
+        self._zoom_accum = 1.0
+
+    def scale_view(self, factor):
+        current_scale = self._current_scale
+        new_scale = max(self.min_zoom, min(self.max_zoom, current_scale * factor))
+        factor = new_scale / current_scale
 
         self.scale(factor, factor)
+        self._current_scale = new_scale
 
     def calculate_radius(self, num_files, node_width):
         desired_horizontal_spacing = 100  # Desired space between nodes
@@ -946,19 +1620,48 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Code Compass")
-        self.create_menus()
+        self.current_folder = None
         file_paths = self.get_file_paths()
         self.diagram = ClusterDiagramWidget(file_paths)
         self.setCentralWidget(self.diagram)
+        # The diagram exists and is never replaced, so menu actions can
+        # connect straight to its bound methods
+        self.create_menus()
+
+        # Refresh on actual filesystem events instead of polling; bursts of
+        # change notifications are coalesced into a single refresh
+        self.folder_watcher = QFileSystemWatcher(self)
+        self.folder_watcher.directoryChanged.connect(
+            lambda path: self.refresh_timer.start()
+        )
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(500)
+        self.refresh_timer.timeout.connect(self.refresh_folder)
+        self.watch_folder(self.current_folder)
+
         self.showMaximized()
 
-        self.statusBar().showMessage("Ready")
+        self._status_label.setText("Ready")
+
+    def watch_folder(self, folder_path):
+        """Point the filesystem watcher at the currently open folder."""
+        watched = self.folder_watcher.directories()
+        if watched:
+            self.folder_watcher.removePaths(watched)
+        if folder_path:
+            self.folder_watcher.addPath(str(folder_path))
+
+    def refresh_folder(self):
+        """Re-sync the diagram with the watched folder's current files."""
+        if self.current_folder:
+            self.diagram.update_file_paths(list_files(self.current_folder))
 
     def update_status(self):
         """Update status bar with current progress."""
         total = len(self.diagram.nodes)
         current = self.diagram.current_explanation_index
-        self.statusBar().showMessage(f"Explaining file {current}/{total}")
+        self._status_label.setText(f"Explaining file {current}/{total}")
 
     def get_file_paths(self):
         # Open folder selection dialog
@@ -970,9 +1673,8 @@ class MainWindow(QMainWindow):
         )
 
         if folder_path:
-            # Convert to Path object
-            folder_path = Path(folder_path)
-            return [str(f) for f in folder_path.iterdir() if f.is_file()]
+            self.current_folder = folder_path
+            return list_files(folder_path)
         else:
             return []
 
@@ -1003,17 +1705,17 @@ class MainWindow(QMainWindow):
         zoom_in_action = QAction("Zoom &In", self)
         zoom_in_action.setShortcut("Ctrl++")
         zoom_in_action.setStatusTip("Zoom in")
-        zoom_in_action.triggered.connect(lambda: self.diagram.zoom_in())
+        zoom_in_action.triggered.connect(self.diagram.zoom_in)
 
         zoom_out_action = QAction("Zoom &Out", self)
         zoom_out_action.setShortcut("Ctrl+-")
         zoom_out_action.setStatusTip("Zoom out")
-        zoom_out_action.triggered.connect(lambda: self.diagram.zoom_out())
+        zoom_out_action.triggered.connect(self.diagram.zoom_out)
 
         reset_zoom_action = QAction("&Reset Zoom", self)
         reset_zoom_action.setShortcut("Ctrl+0")
         reset_zoom_action.setStatusTip("Reset zoom level")
-        reset_zoom_action.triggered.connect(lambda: self.diagram.fit_in_view())
+        reset_zoom_action.triggered.connect(self.diagram.fit_in_view)
 
         view_menu.addAction(zoom_in_action)
         view_menu.addAction(zoom_out_action)
@@ -1025,6 +1727,8 @@ class MainWindow(QMainWindow):
         explain_next_action = QAction("Explain Next File", self)
         explain_next_action.setShortcut(QKeySequence("Ctrl+Shift+E"))
         explain_next_action.setStatusTip("Explain next file")
+        # A held shortcut would queue a flood of explanations
+        explain_next_action.setAutoRepeat(False)
         explain_next_action.triggered.connect(self.explain_next)
 
         tools_menu.addAction(explain_next_action)
@@ -1033,16 +1737,19 @@ class MainWindow(QMainWindow):
         stop_explanation_action = QAction("&Stop Explanation", self)
         stop_explanation_action.setShortcut("Esc")
         stop_explanation_action.setStatusTip("Stop current explanation")
+        stop_explanation_action.setAutoRepeat(False)
         stop_explanation_action.triggered.connect(self.stop_current_explanation)
         tools_menu.addAction(stop_explanation_action)
 
-        # Create status bar
-        self.statusBar()
+        # Create status bar with a persistent label; setText schedules an
+        # async repaint where showMessage forces a synchronous one
+        self._status_label = QLabel("Ready")
+        self.statusBar().addPermanentWidget(self._status_label)
 
     def explain_next(self):
         """Explain the next file."""
         if not self.diagram.explain_next_node():
-            self.statusBar().showMessage("All files explained")
+            self._status_label.setText("All files explained")
             return False
         else:
             self.update_status()
@@ -1050,11 +1757,10 @@ class MainWindow(QMainWindow):
 
     def stop_current_explanation(self):
         """Stop the currently running explanation if any"""
-        for node in self.diagram.nodes:
-            if node.filename_label.is_worker_running:
-                node.filename_label.stop_explanation()
-                self.statusBar().showMessage("Explanation stopped")
-                break
+        node = self.diagram._active_worker_node
+        if node:
+            node.filename_label.stop_explanation()
+            self._status_label.setText("Explanation stopped")
 
     def open_new_folder(self):
         folder_path = QFileDialog.getExistingDirectory(
@@ -1065,10 +1771,23 @@ class MainWindow(QMainWindow):
         )
 
         if folder_path:
-            # Create new diagram with selected folder
-            file_paths = [str(f) for f in Path(folder_path).iterdir() if f.is_file()]
-            self.diagram = ClusterDiagramWidget(file_paths)
-            self.setCentralWidget(self.diagram)
+            # Enumerate on the thread pool; a big or networked folder would
+            # otherwise freeze the event loop before the diagram appears
+            self.current_folder = folder_path
+            self._status_label.setText("Scanning folder...")
+            self._scan_worker = FileScanWorker(folder_path)
+            self._scan_worker.signals.finished.connect(self.on_folder_scanned)
+            QThreadPool.globalInstance().start(self._scan_worker)
+
+    def on_folder_scanned(self, folder_path, file_paths):
+        """Repopulate the diagram once the background folder scan completes."""
+        if folder_path != self.current_folder:
+            # A slower scan of a previously selected folder finished after
+            # the user already opened another one; drop the stale result
+            return
+        self.diagram.update_file_paths(file_paths)
+        self.watch_folder(self.current_folder)
+        self._status_label.setText("Ready")
 
 
 def resource_path(relative_path):